@@ -1,45 +1,269 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import os
 import json
-from scipy.stats import ttest_ind
-import statsmodels.api as sm
+import argparse
+import re
+import sys
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Smaller arrays are correlated with NumPy alone: the kernel saves too
+# little there to be worth importing numba for
+NUMBA_MIN_SIZE = 5_000_000
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HIST_SAMPLE_SIZE = 100_000
+WIDE_FRAME_COLUMNS = 200
+
+_describe_cache = {}
+_column_cache = {}
+_numeric_cache = {}
+
+# Set by enable_batch_mode: charts are saved here instead of being shown
+_batch_outdir = None
+_render_pool = None
+_pending_render = None
 
 def validate_file_path(file_path):
     if not os.path.exists(file_path):
         return False, f"File '{file_path}' does not exist."
-    if not file_path.endswith(('.csv', '.xls', '.xlsx')):
-        return False, "Unsupported file format. Please provide a CSV or Excel file."
+    if not file_path.endswith(('.csv', '.xls', '.xlsx', '.parquet', '.feather')):
+        return False, "Unsupported file format. Please provide a CSV, Excel, Parquet or Feather file."
     return True, None
 
 def validate_column_name(column_name, df):
-    if column_name not in df.columns:
+    if column_name not in cached_columns(df):
         return False, f"Column '{column_name}' does not exist in the dataset."
     return True, None
 
+def prompt_columns(df, *prompts):
+    """
+    Ask for one column name per prompt and validate each against the dataset.
+
+    :param df: Pandas DataFrame.
+    :param prompts: Input prompts, one per column.
+    :return: List of column names, or None if any of them is invalid.
+    """
+    columns = [input(prompt) for prompt in prompts]
+    for column in columns:
+        is_valid, error_message = validate_column_name(column, df)
+        if not is_valid:
+            print(error_message)
+            return None
+    return columns
+
 def validate_menu_choice(choice, valid_options):
     while choice not in valid_options:
         print(f"Invalid choice. Please select from {valid_options}.")
         choice = input("Enter your choice: ")
     return choice
 
-def load_data(file_path):
+def _is_plain_numeric(dtype):
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+def read_csv_chunks(file_path, chunksize=50_000, usecols=None, dtype=None):
     """
-    Load data from a CSV or Excel file into a Pandas DataFrame.
+    Read a CSV file in chunks of `chunksize` rows and combine them.
+
+    Integer columns of each chunk are downcast before the chunks are combined,
+    except those given an explicit type in `dtype`.
+
+    The parser infers types per chunk, so a column can come out numeric in one
+    chunk and text in another. Such columns are re-read as text in a second
+    pass, giving the same result as a single `pd.read_csv` call.
+
+    :param file_path: Path to the CSV file.
+    :param chunksize: Number of rows to parse per chunk.
+    :param usecols: Optional list of columns to load.
+    :param dtype: Optional column-to-dtype mapping passed to the parser.
+    :return: Pandas DataFrame.
+    """
+    explicit = list(dtype or {})
+
+    def read(dtype):
+        return [downcast_dtypes(chunk, categorize=False, exclude=explicit)
+                for chunk in pd.read_csv(file_path, chunksize=chunksize,
+                                         usecols=usecols, dtype=dtype)]
+
+    chunks = read(dtype)
+    if not chunks:  # header-only file
+        return pd.read_csv(file_path, usecols=usecols, dtype=dtype)
+    mixed = [column for column in chunks[0].columns
+             if len({str(chunk[column].dtype) for chunk in chunks}) > 1
+             and not all(_is_plain_numeric(chunk[column].dtype) for chunk in chunks)]
+    if mixed:
+        del chunks
+        chunks = read({**(dtype or {}), **{column: str for column in mixed}})
+    return pd.concat(chunks, ignore_index=True)
+
+def write_parquet_cache(df, cache_path):
+    """
+    Write a DataFrame to `cache_path` as zstd-compressed Parquet.
+
+    The data is written under a temporary name and moved into place, so an
+    interrupted write never leaves a truncated cache behind. Failures are
+    reported and otherwise ignored, since the cache is only an optimisation.
+
+    :param df: Pandas DataFrame.
+    :param cache_path: Path of the Parquet cache file.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Parquet cache not written: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def downcast_dtypes(df, categorize=True, exclude=()):
+    """
+    Shrink column dtypes in place to the smallest type that holds the data.
+
+    Integer columns are downcast numerically and text columns where fewer
+    than half the values are distinct become categoricals. Float columns are
+    left as they are: statistics on float32 would no longer match float64.
+
+    :param df: Pandas DataFrame.
+    :param categorize: Also convert low-cardinality text columns to categoricals.
+    :param exclude: Columns to leave untouched, e.g. those with explicit dtypes.
+    :return: The same DataFrame with downcast dtypes.
+    """
+    for column in df.select_dtypes(include='integer').columns.difference(exclude):
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    if not categorize:
+        return df
+    for column in df.select_dtypes(include=['object', 'string']).columns.difference(exclude):
+        if len(df) and df[column].nunique() / len(df) < 0.5:
+            df[column] = df[column].astype('category')
+    return df
+
+def load_data(file_path, chunksize=50_000, usecols=None, cache=False):
+    """
+    Load data from a CSV, Excel, Parquet or Feather file into a Pandas DataFrame.
+
+    CSV files are read in chunks of `chunksize` rows with `read_csv_chunks`.
+    With `cache` enabled, a parsed CSV is also written as `<file>.parquet`
+    (e.g. `data.csv.parquet`) and that copy is read instead on later runs, as
+    long as it is newer than the CSV and its dtypes sidecar. An unreadable
+    cache is ignored and the CSV is parsed again.
+
+    Sidecar files are named after the full source file name: if
+    `<file>.dtypes.json` (e.g. `data.csv.dtypes.json`) maps column names to
+    dtypes, it is passed to the CSV parser to skip type inference. Parsed CSV
+    and Excel data is downcast with `downcast_dtypes`, leaving the columns the
+    sidecar names untouched.
 
     :param file_path: Path to the data file.
+    :param chunksize: Number of CSV rows to parse per chunk.
+    :param usecols: Optional list of columns to load (CSV, Parquet and Feather).
+    :param cache: Read from / write to a Parquet cache for CSV files.
     :return: Pandas DataFrame.
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
 
     if file_path.endswith('.csv'):
-        return pd.read_csv(file_path)
-    elif file_path.endswith(('.xls', '.xlsx')):
-        return pd.read_excel(file_path)
+        cache_path = file_path + '.parquet'
+        dtypes_path = file_path + '.dtypes.json'
+        sources = [file_path] + ([dtypes_path] if os.path.exists(dtypes_path) else [])
+        if cache and os.path.exists(cache_path) and \
+                os.path.getmtime(cache_path) >= max(map(os.path.getmtime, sources)):
+            try:
+                return pd.read_parquet(cache_path, columns=usecols)
+            except Exception as e:
+                print(f"Ignoring unreadable Parquet cache: {e}")
+        dtype = None
+        if os.path.exists(dtypes_path):
+            with open(dtypes_path) as f:
+                dtype = json.load(f)
+        df = read_csv_chunks(file_path, chunksize, usecols, dtype)
+        downcast_dtypes(df, exclude=list(dtype or {}))
+        if cache and usecols is None:
+            write_parquet_cache(df, cache_path)
+        return df
+    elif file_path.endswith('.xlsx'):
+        return downcast_dtypes(pd.read_excel(file_path, engine='openpyxl'))
+    elif file_path.endswith('.xls'):
+        return downcast_dtypes(pd.read_excel(file_path, engine='xlrd'))
+    elif file_path.endswith('.parquet'):
+        return pd.read_parquet(file_path, columns=usecols)
+    elif file_path.endswith('.feather'):
+        return pd.read_feather(file_path, columns=usecols)
     else:
-        raise ValueError("Unsupported file format. Please use CSV or Excel files.")
+        raise ValueError("Unsupported file format. Please use CSV, Excel, Parquet or Feather files.")
+
+def _cached(cache, key, df, compute):
+    # Entries hold only a weak reference to their DataFrame: a recycled id()
+    # can never match another frame, and entries are dropped once it is freed.
+    entry = cache.get(key)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    value = compute()
+    cache[key] = (weakref.ref(df), value)
+    weakref.finalize(df, cache.pop, key, None)
+    return value
+
+def cached_describe(df, full=False):
+    """
+    Return `df.describe(include='all')`, computing it at most once per DataFrame.
+
+    Unless `full` is set, frames wider than `WIDE_FRAME_COLUMNS` only describe
+    their numerical columns, skipping the per-column value counts of text
+    columns.
+
+    Entries are keyed on the DataFrame's identity and shape; callers that
+    modify a DataFrame in place must call `clear_caches`.
+
+    :param df: Pandas DataFrame.
+    :param full: Always describe every column, however wide the frame is.
+    :return: Pandas DataFrame of summary statistics.
+    """
+    full = full or df.shape[1] <= WIDE_FRAME_COLUMNS
+    return _cached(_describe_cache, (id(df), df.shape, full), df,
+                   lambda: df.describe(include='all') if full else df.describe())
+
+def cached_columns(df):
+    """
+    Return the DataFrame's column names as a frozenset, built once per DataFrame.
+
+    :param df: Pandas DataFrame.
+    :return: frozenset of column names.
+    """
+    return _cached(_column_cache, (id(df), df.shape), df,
+                   lambda: frozenset(df.columns))
+
+def cached_numeric(df):
+    """
+    Return the numerical columns as one read-only, C-contiguous float64 array,
+    built once per DataFrame. Missing values are stored as NaN.
+
+    :param df: Pandas DataFrame.
+    :return: Tuple of (2-D ndarray, list of column names).
+    """
+    def build():
+        num = df.select_dtypes(include='number')
+        X = np.ascontiguousarray(num.to_numpy(dtype=np.float64, na_value=np.nan))
+        X.flags.writeable = False
+        return X, list(num.columns)
+
+    return _cached(_numeric_cache, (id(df), df.shape), df, build)
+
+def clear_caches():
+    """
+    Drop all cached per-DataFrame results after the data has been modified.
+    """
+    _describe_cache.clear()
+    _column_cache.clear()
+    _numeric_cache.clear()
 
 def summarize_data(df):
     """
@@ -50,7 +274,81 @@ def summarize_data(df):
     print("Basic Dataset Information:\n")
     print(df.info())
     print("\nSummary Statistics:\n")
-    print(df.describe(include='all'))
+    print(cached_describe(df))
+
+def quick_summary(df):
+    """
+    Display count, mean, standard deviation, minimum and maximum of the
+    numerical columns, without the sorting needed for percentiles.
+
+    :param df: Pandas DataFrame.
+    """
+    num = df.select_dtypes(include='number')
+    if num.columns.empty:
+        print("The dataset has no numerical columns to summarize.")
+        return
+    print("\nQuick Summary:\n")
+    print(num.agg(['count', 'mean', 'std', 'min', 'max']))
+
+def enable_batch_mode(outdir):
+    """
+    Save charts as PNG files in `outdir` instead of opening plot windows.
+
+    Figures are built on the main thread and rasterized and written to disk by
+    a background worker, so menu prompts and data work overlap with the write.
+    Matplotlib is not thread-safe, so the next figure is only started once the
+    previous one has been written (see `wait_for_pending_render`).
+
+    :param outdir: Directory to write the charts to.
+    """
+    global _batch_outdir, _render_pool
+    import matplotlib
+    matplotlib.use('Agg')
+    os.makedirs(outdir, exist_ok=True)
+    _batch_outdir = outdir
+    _render_pool = ThreadPoolExecutor(max_workers=1)
+
+def wait_for_renders():
+    """
+    Block until all charts queued in batch mode have been written.
+    """
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=True)
+
+def wait_for_pending_render():
+    """
+    Block until the chart queued by the last `show_figure` call has been
+    written, so pyplot is never used while the worker is rasterizing.
+    """
+    if _pending_render is not None:
+        wait([_pending_render])
+
+def _report_render_error(future):
+    if future.exception() is not None:
+        print(f"Failed to save chart: {future.exception()}")
+
+def show_figure(name):
+    """
+    Display the current figure without blocking the menu, or queue it to be
+    saved as `<name>.png` in batch mode.
+
+    :param name: File name (without extension) used in batch mode; characters
+        that are unsafe in file names are replaced with underscores.
+    """
+    global _pending_render
+    import matplotlib.pyplot as plt
+
+    if _batch_outdir is None:
+        plt.show(block=False)
+        plt.pause(0.1)
+        return
+
+    fig = plt.gcf()
+    plt.close(fig)
+    path = os.path.join(_batch_outdir, re.sub(r'[^\w.-]+', '_', name) + '.png')
+    _pending_render = _render_pool.submit(fig.savefig, path, dpi=100, bbox_inches='tight')
+    _pending_render.add_done_callback(_report_render_error)
+    print(f"Chart queued for {path}")
 
 def visualize_data(df, column_x, column_y=None, chart_type='histogram'):
     """
@@ -61,14 +359,31 @@ def visualize_data(df, column_x, column_y=None, chart_type='histogram'):
     :param column_y: Column name for the y-axis (optional).
     :param chart_type: Type of chart ('histogram', 'scatter', 'boxplot', 'line').
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
 
 
     
+    wait_for_pending_render()
     plt.figure(figsize=(10, 6))
 
     if chart_type == 'histogram':
-        sns.histplot(df[column_x], kde=True)
-        plt.title(f'Histogram of {column_x}')
+        # The KDE cost grows with the sample, so large columns are subsampled;
+        # each sampled value is weighted so the bars still estimate full counts
+        values = df[column_x].dropna().to_numpy()
+        title = f'Histogram of {column_x}'
+        weights = None
+        bins = 'auto'
+        if values.size > HIST_SAMPLE_SIZE:
+            idx = np.random.default_rng(0).choice(values.size, HIST_SAMPLE_SIZE, replace=False)
+            weights = np.full(HIST_SAMPLE_SIZE, values.size / HIST_SAMPLE_SIZE)
+            values = values[idx]
+            if pd.api.types.is_numeric_dtype(values):
+                # seaborn cannot pick 'auto' bins for weighted data
+                bins = len(np.histogram_bin_edges(values, bins='auto')) - 1
+            title += f' (estimated from a {HIST_SAMPLE_SIZE:,}-value sample)'
+        sns.histplot(x=values, weights=weights, bins=bins, kde=True)
+        plt.title(title)
     elif chart_type == 'scatter':
         if column_y is None:
             raise ValueError("column_y must be specified for scatter plots.")
@@ -88,18 +403,41 @@ def visualize_data(df, column_x, column_y=None, chart_type='histogram'):
     plt.xlabel(column_x)
     if column_y:
         plt.ylabel(column_y)
-    plt.show()
+    name = f"{chart_type}_{column_x}" + (f"_{column_y}" if column_y else "")
+    show_figure(name)
 
 def export_summary(df, output_path):
     """
-    Export summary statistics to a JSON file.
+    Export summary statistics to a JSON file, using orjson when it is installed.
+
+    Every column is included, also on frames wider than `WIDE_FRAME_COLUMNS`.
 
     :param df: Pandas DataFrame.
     :param output_path: Path to save the JSON file.
     """
-    summary = df.describe(include='all').to_dict()
-    with open(output_path, 'w') as f:
-        json.dump(summary, f, indent=4)
+    def to_json_value(value):
+        # NaN/NaT become null, infinities the strings "inf"/"-inf" and NumPy
+        # scalars plain Python values, so both serializers write the same,
+        # valid JSON
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            return None
+        if isinstance(value, (float, np.floating)) and np.isinf(value):
+            return str(float(value))
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    summary = {
+        str(column): {str(stat): to_json_value(value) for stat, value in stats.items()}
+        for column, stats in cached_describe(df, full=True).to_dict().items()
+    }
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(summary, default=str,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(summary, f, indent=2, default=str, allow_nan=False)
     print(f"Summary exported to {output_path}")
 
 def handle_missing_data(df):
@@ -121,70 +459,195 @@ def handle_missing_data(df):
     choice = validate_menu_choice(input("Choose an option (1-6): "), valid_options)
     
     if choice == '1':
+        counts = df.isnull().sum()
         print("\nMissing Data Summary:")
-        print(df.isnull().sum())
+        print(counts)
         print("\nPercentage of Missing Data:")
-        print((df.isnull().mean() * 100).round(2))
+        print((counts / max(len(df), 1) * 100).round(2))
     elif choice == '2':
         df.dropna(inplace=True)
+        clear_caches()
         print("Rows with missing values have been dropped.")
     elif choice == '3':
         df.dropna(axis=1, inplace=True)
+        clear_caches()
         print("Columns with missing values have been dropped.")
     elif choice == '4':
         value = input("Enter the value to fill missing data: ")
+        for column in df.select_dtypes(include='category').columns:
+            if value not in df[column].cat.categories:
+                df[column] = df[column].cat.add_categories([value])
         df.fillna(value, inplace=True)
+        clear_caches()
         print("Missing values have been filled with the specified value.")
     elif choice == '5':
         method = input("Choose a method (mean/median/mode): ").lower()
-        if method == 'mean':
-            df.fillna(df.mean(), inplace=True)
-        elif method == 'median':
-            df.fillna(df.median(), inplace=True)
+        if method in ('mean', 'median'):
+            X, num_cols = cached_numeric(df)
+            reduce = np.nanmean if method == 'mean' else np.nanmedian
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+                fills = pd.Series(reduce(X, axis=0), index=num_cols)
+            df[num_cols] = df[num_cols].fillna(fills)
         elif method == 'mode':
-            for column in df.columns:
-                df[column].fillna(df[column].mode()[0], inplace=True)
+            modes = df.mode(dropna=True).iloc[0].dropna()
+            df.fillna(modes, inplace=True)
         else:
             print("Invalid method. Returning to the menu.")
+        clear_caches()
         print(f"Missing values have been filled using the {method} method.")
     elif choice == '6':
         print("Returning to the main menu.")
     
     return df
 
+def _corr_numpy(X):
+    X = X - X.mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = 1.0 / np.sqrt((X * X).sum(axis=0))
+        return (X.T @ X) * np.multiply.outer(s, s)
+
+def _corr_pairwise(X):
+    # Pearson correlation over pairwise-complete rows, as in DataFrame.corr,
+    # built from a handful of matrix products over the NaN mask.
+    M = ~np.isnan(X)
+    Mf = M.astype(np.float64)
+    X = np.where(M, X, 0.0)
+    # Centring on the column means keeps the sums below well-conditioned
+    X = np.where(M, X - X.sum(axis=0) / np.maximum(Mf.sum(axis=0), 1.0), 0.0)
+    n = Mf.T @ Mf
+    sx = X.T @ Mf                # sums of column i over rows where j is present
+    sxx = (X * X).T @ Mf
+    sxy = X.T @ X
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sx.T / n
+        var_x = sxx - sx * sx / n
+        C = cov / np.sqrt(var_x * var_x.T)
+    C[n < 2] = np.nan
+    return np.clip(C, -1.0, 1.0)
+
+_center_kernel = None
+
+def _get_center_kernel():
+    # numba is slow to import, so the kernel is only compiled (or loaded from
+    # numba's on-disk cache) the first time it is needed; None without numba.
+    global _center_kernel
+    if _center_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _center_kernel = False
+            return None
+
+        # fastmath without the no-NaN/no-Inf flags: zero-variance columns must
+        # still come out as NaN like they do in pandas.
+        @njit(fastmath={'reassoc', 'contract', 'arcp'}, cache=True)
+        def kernel(X):
+            # Row-outer passes over the C-contiguous array: one for the column
+            # sums, one writing the centred copy and the sums of squares.
+            n, k = X.shape
+            mean = np.zeros(k)
+            for i in range(n):
+                for j in range(k):
+                    mean[j] += X[i, j]
+            mean /= n
+            Xc = np.empty((n, k))
+            ss = np.zeros(k)
+            for i in range(n):
+                for j in range(k):
+                    d = X[i, j] - mean[j]
+                    Xc[i, j] = d
+                    ss[j] += d * d
+            s = np.empty(k)
+            for j in range(k):
+                s[j] = 1.0 / np.sqrt(ss[j]) if ss[j] > 0.0 else np.nan
+            return Xc, s
+
+        _center_kernel = kernel
+    return _center_kernel or None
+
+def _corr_dense(X):
+    kernel = _get_center_kernel() if X.size >= NUMBA_MIN_SIZE else None
+    if kernel is None:
+        return _corr_numpy(X)
+    Xc, s = kernel(X)
+    C = Xc.T @ Xc  # NumPy runs X.T @ X as a symmetric BLAS product
+    C *= np.multiply.outer(s, s)
+    return C
+
+def pearson_correlation(df):
+    """
+    Compute the Pearson correlation matrix of the numerical columns.
+
+    Dense data is centred and scaled once and multiplied in a single matrix
+    product. For large arrays the centring runs in a compiled kernel when
+    numba is installed. Data with missing values uses pairwise-complete
+    observations like `DataFrame.corr`, computed with masked matrix products.
+
+    :param df: Pandas DataFrame.
+    :return: Pandas DataFrame with the correlation matrix.
+    """
+    X, num_cols = cached_numeric(df)
+    if np.isnan(X).any():
+        C = _corr_pairwise(X)
+    else:
+        C = _corr_dense(X)
+    return pd.DataFrame(C, index=num_cols, columns=num_cols)
+
 def correlation_matrix(df):
     """
     Display the correlation matrix for numerical columns in the dataset.
 
     :param df: Pandas DataFrame.
     """
+    import matplotlib.pyplot as plt
+
     print("\nCorrelation Matrix:")
-    correlation = df.corr()
+    correlation = pearson_correlation(df)
     print(correlation)
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(correlation, annot=True, cmap='coolwarm', fmt='.2f')
-    plt.title('Correlation Matrix')
-    plt.show()
+
+    # A single image instead of one artist per cell; only small matrices
+    # get per-cell labels.
+    values = correlation.to_numpy()
+    n = len(correlation.columns)
+    wait_for_pending_render()
+    fig, ax = plt.subplots(figsize=(10, 8))
+    im = ax.imshow(values, cmap='coolwarm', vmin=-1, vmax=1)
+    fig.colorbar(im)
+    ax.set_xticks(range(n))
+    ax.set_xticklabels(correlation.columns, rotation=90)
+    ax.set_yticks(range(n))
+    ax.set_yticklabels(correlation.columns)
+    if n <= 20:
+        for i in range(n):
+            for j in range(n):
+                ax.text(j, i, f'{values[i, j]:.2f}', ha='center', va='center')
+    ax.set_title('Correlation Matrix')
+    show_figure('correlation_matrix')
+
 def hypothesis_testing(df):
     """
     Perform a t-test between two numerical columns in the dataset.
 
     :param df: Pandas DataFrame.
     """
-    column_x = input("Enter the first numerical column for hypothesis testing: ")
-    column_y = input("Enter the second numerical column for hypothesis testing: ")
-
-    is_valid_x, error_message_x = validate_column_name(column_x, df)
-    is_valid_y, error_message_y = validate_column_name(column_y, df)
+    from scipy.stats import ttest_ind
 
-    if not is_valid_x:
-        print(error_message_x)
-        return
-    if not is_valid_y:
-        print(error_message_y)
+    columns = prompt_columns(df, "Enter the first numerical column for hypothesis testing: ",
+                             "Enter the second numerical column for hypothesis testing: ")
+    if columns is None:
         return
+    column_x, column_y = columns
 
-    t_stat, p_value = ttest_ind(df[column_x].dropna(), df[column_y].dropna())
+    X, num_cols = cached_numeric(df)
+    for column in (column_x, column_y):
+        if column not in num_cols:
+            print(f"Column '{column}' is not numerical.")
+            return
+
+    a = X[:, num_cols.index(column_x)]
+    b = X[:, num_cols.index(column_y)]
+    t_stat, p_value = ttest_ind(a[~np.isnan(a)], b[~np.isnan(b)])
     print(f"\nT-Test Results:")
     print(f"T-Statistic: {t_stat}")
     print(f"P-Value: {p_value}")
@@ -193,41 +656,73 @@ def regression_analysis(df):
     """
     Perform simple linear regression between two numerical columns.
 
+    By default the closed-form `scipy.stats.linregress` result is printed;
+    the full statsmodels OLS summary is only built when requested.
+
     :param df: Pandas DataFrame.
     """
-    column_x = input("Enter the independent variable (x-axis): ")
-    column_y = input("Enter the dependent variable (y-axis): ")
-
-    is_valid_x, error_message_x = validate_column_name(column_x, df)
-    is_valid_y, error_message_y = validate_column_name(column_y, df)
+    from scipy.stats import linregress
 
-    if not is_valid_x:
-        print(error_message_x)
-        return
-    if not is_valid_y:
-        print(error_message_y)
+    columns = prompt_columns(df, "Enter the independent variable (x-axis): ",
+                             "Enter the dependent variable (y-axis): ")
+    if columns is None:
         return
+    column_x, column_y = columns
 
-    X = df[column_x].dropna()
-    Y = df[column_y].dropna()
+    # Keep only rows where both variables are present so X and Y stay paired
+    mask = df[[column_x, column_y]].notna().all(axis=1)
+    X = df.loc[mask, column_x].to_numpy(dtype=np.float64)
+    Y = df.loc[mask, column_y].to_numpy(dtype=np.float64)
 
-    X = sm.add_constant(X)  # Add constant term for regression
-    model = sm.OLS(Y, X).fit()
+    full_summary = input("Show full OLS summary? (y/n): ").strip().lower() == 'y'
     print("\nRegression Analysis Results:")
-    print(model.summary())
+    if not full_summary:
+        try:
+            res = linregress(X, Y)
+        except ValueError as e:  # e.g. a constant predictor
+            print(f"{e}; showing the full OLS summary instead.")
+            full_summary = True
+    if full_summary:
+        import statsmodels.api as sm
+
+        X = np.column_stack([np.ones_like(X), X])  # Add constant term for regression
+        model = sm.OLS(Y, X).fit()
+        print(model.summary(yname=column_y, xname=['const', column_x]))
+    else:
+        print(f"Slope: {res.slope}")
+        print(f"Intercept: {res.intercept}")
+        print(f"R-Value: {res.rvalue}")
+        print(f"P-Value: {res.pvalue}")
+        print(f"Standard Error: {res.stderr}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Academic Research Data Analysis Tool")
+    parser.add_argument('--cache', action='store_true',
+                        help="Cache parsed CSV files as Parquet for faster reloads.")
+    parser.add_argument('--batch', action='store_true',
+                        help="Save charts as PNG files instead of displaying them "
+                             "(implied when input is not a terminal).")
+    parser.add_argument('--outdir', default='.',
+                        help="Directory for charts saved in batch mode (default: current directory).")
+    args = parser.parse_args()
+
+    if args.batch or not sys.stdin.isatty():
+        enable_batch_mode(args.outdir)
+
     print("Academic Research Data Analysis Tool\n")
     
-    file_path = input("Enter the path to your data file (CSV/Excel): ")
+    file_path = input("Enter the path to your data file (CSV/Excel/Parquet/Feather): ")
     is_valid, error_message = validate_file_path(file_path)
     if not is_valid:
         print(error_message)
         return
 
-    df = load_data(file_path)
+    df = load_data(file_path, cache=args.cache)
     summarize_data(df)
 
+    # Menu choices that plot one column against another
+    xy_charts = {'2': 'scatter', '3': 'boxplot', '4': 'line', '6': 'bar'}
+
     while True:
         print("\nVisualization Options:")
         print("1. Histogram")
@@ -240,84 +735,43 @@ def main():
         print("8. Heatmap")
         print("9. Pie Chart")
         print("10.Exit ")
+        print("11. Quick Summary")
 
-        valid_options = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10']
-        choice = validate_menu_choice(input("Choose an option (1-7): "), valid_options)
+        valid_options = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11']
+        choice = validate_menu_choice(input("Choose an option (1-11): "), valid_options)
         
         if choice == '1':
-            column_x = input("Enter the column name for the x-axis: ")
-            is_valid, error_message = validate_column_name(column_x, df)
-            if not is_valid:
-                print(error_message)
-                continue
-            visualize_data(df, column_x, chart_type='histogram')
-        elif choice == '2':
-            column_x = input("Enter the column name for the x-axis: ")
-            column_y = input("Enter the column name for the y-axis: ")
-            is_valid_x, error_message_x = validate_column_name(column_x, df)
-            is_valid_y, error_message_y = validate_column_name(column_y, df)
-            if not is_valid_x:
-                print(error_message_x)
-                continue
-            if not is_valid_y:
-                print(error_message_y)
+            columns = prompt_columns(df, "Enter the column name for the x-axis: ")
+            if columns is None:
                 continue
-            visualize_data(df, column_x, column_y, chart_type='scatter')
-        elif choice == '3':
-            column_x = input("Enter the column name for the x-axis: ")
-            column_y = input("Enter the column name for the y-axis: ")
-            is_valid_x, error_message_x = validate_column_name(column_x, df)
-            is_valid_y, error_message_y = validate_column_name(column_y, df)
-            if not is_valid_x:
-                print(error_message_x)
+            visualize_data(df, *columns, chart_type='histogram')
+        elif choice in xy_charts:
+            columns = prompt_columns(df, "Enter the column name for the x-axis: ",
+                                     "Enter the column name for the y-axis: ")
+            if columns is None:
                 continue
-            if not is_valid_y:
-                print(error_message_y)
-                continue
-            visualize_data(df, column_x, column_y, chart_type='boxplot')
-        elif choice == '4':
-            column_x = input("Enter the column name for the x-axis: ")
-            column_y = input("Enter the column name for the y-axis: ")
-            is_valid_x, error_message_x = validate_column_name(column_x, df)
-            is_valid_y, error_message_y = validate_column_name(column_y, df)
-            if not is_valid_x:
-                print(error_message_x)
-                continue
-            if not is_valid_y:
-                print(error_message_y)
-                continue
-            visualize_data(df, column_x, column_y, chart_type='line')
+            visualize_data(df, *columns, chart_type=xy_charts[choice])
         elif choice == '5':
             output_path = input("Enter the path to save the summary (JSON): ")
             export_summary(df, output_path)
-        elif choice == '6':  # Bar Chart
-            column_x = input("Enter the column name for the x-axis: ")
-            column_y = input("Enter the column name for the y-axis: ")
-            is_valid_x, error_message_x = validate_column_name(column_x, df)
-            is_valid_y, error_message_y = validate_column_name(column_y, df)
-            if not is_valid_x:
-                print(error_message_x)
-                continue
-            if not is_valid_y:
-                print(error_message_y)
-                continue
-            visualize_data(df, column_x, column_y, chart_type='bar')
         elif choice == '7':  # Heatmap
             visualize_data(df, chart_type='heatmap')
         elif choice == '8':  # Pie Chart
-            column_x = input("Enter the column name for the categorical data: ")
-            is_valid, error_message = validate_column_name(column_x, df)
-            if not is_valid:
-                print(error_message)
+            columns = prompt_columns(df, "Enter the column name for the categorical data: ")
+            if columns is None:
                 continue
-            visualize_data(df, column_x, chart_type='pie')
+            visualize_data(df, *columns, chart_type='pie')
        
         elif choice == '9':
             df = handle_missing_data(df)
         
         elif choice == '10':
+            wait_for_renders()
             print("Exiting the tool. Goodbye!")
             break
+
+        elif choice == '11':
+            quick_summary(df)
         
 
 if __name__ == "__main__":